@@ -29,63 +29,61 @@ The arg spec for the ios_evpn_evi module
 """
 
 
-class Evpn_eviArgs(object):  # pylint: disable=R0903
-    """The arg spec for the ios_evpn_evi module"""
+_BOOL = {"type": "bool"}
+_ENABLE_DISABLE = {"type": "dict", "options": {"enable": _BOOL, "disable": _BOOL}}
 
-    argument_spec = {
-        "config": {
-            "type": "list",
-            "elements": "dict",
-            "options": {
-                "evi": {"type": "int", "required": True},
-                "default_gateway": {
-                    "type": "dict",
-                    "options": {
-                        "advertise": {
-                            "type": "dict",
-                            "options": {
-                                "enable": {"type": "bool"},
-                                "disable": {"type": "bool"},
-                            },
-                        },
-                    },
-                },
-                "ip": {
-                    "type": "dict",
-                    "options": {
-                        "local_learning": {
-                            "type": "dict",
-                            "options": {
-                                "enable": {"type": "bool"},
-                                "disable": {"type": "bool"},
-                            },
-                        },
-                    },
-                },
-                "encapsulation": {
-                    "type": "str",
-                    "choices": ["vxlan"],
-                    "default": "vxlan",
+_ENCAPSULATION_CHOICES = ("vxlan",)
+_REPLICATION_TYPE_CHOICES = ("ingress", "static")
+_STATE_CHOICES = (
+    "merged",
+    "replaced",
+    "overridden",
+    "deleted",
+    "gathered",
+    "rendered",
+    "parsed",
+)
+
+_ARGUMENT_SPEC = {
+    "config": {
+        "type": "list",
+        "elements": "dict",
+        "options": {
+            "evi": {"type": "int", "required": True},
+            "default_gateway": {
+                "type": "dict",
+                "options": {
+                    "advertise": _ENABLE_DISABLE,
                 },
-                "replication_type": {
-                    "type": "str",
-                    "choices": ["ingress", "static"],
+            },
+            "ip": {
+                "type": "dict",
+                "options": {
+                    "local_learning": _ENABLE_DISABLE,
                 },
-                "route_distinguisher": {"type": "str"},
             },
+            "encapsulation": {
+                "type": "str",
+                "choices": _ENCAPSULATION_CHOICES,
+                "default": "vxlan",
+            },
+            "replication_type": {
+                "type": "str",
+                "choices": _REPLICATION_TYPE_CHOICES,
+            },
+            "route_distinguisher": {"type": "str"},
         },
-        "running_config": {"type": "str"},
-        "state": {
-            "type": "str",
-            "choices": [
-                "merged",
-                "replaced",
-                "overridden",
-                "deleted",
-                "gathered",
-                "rendered",
-                "parsed",
-            ],
-            "default": "merged",
-        },
-    }  # pylint: disable=C0301
+    },
+    "running_config": {"type": "str"},
+    "state": {
+        "type": "str",
+        "choices": _STATE_CHOICES,
+        "default": "merged",
+    },
+}  # pylint: disable=C0301
+
+
+class Evpn_eviArgs(object):  # pylint: disable=R0903
+    """The arg spec for the ios_evpn_evi module"""
+
+    argument_spec = _ARGUMENT_SPEC
@@ -32,6 +32,20 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 
+_VLAN_STATE_CHOICES = ("active", "suspend")
+_SHUTDOWN_CHOICES = ("enabled", "disabled")
+_PRIVATE_VLAN_TYPE_CHOICES = ("primary", "community", "isolated")
+_STATE_CHOICES = (
+    "merged",
+    "replaced",
+    "overridden",
+    "deleted",
+    "rendered",
+    "parsed",
+    "gathered",
+)
+
+
 class VlansArgs(object):
     """The arg spec for the ios_vlans module"""
 
@@ -46,12 +60,12 @@ class VlansArgs(object):
                 "vlan_id": {"required": True, "type": "int"},
                 "mtu": {"type": "int"},
                 "remote_span": {"type": "bool"},
-                "state": {"type": "str", "choices": ["active", "suspend"]},
-                "shutdown": {"type": "str", "choices": ["enabled", "disabled"]},
+                "state": {"type": "str", "choices": _VLAN_STATE_CHOICES},
+                "shutdown": {"type": "str", "choices": _SHUTDOWN_CHOICES},
                 "private_vlan": {
                     "type": "dict",
                     "options": {
-                        "type": {"type": "str", "choices": ["primary", "community", "isolated"]},
+                        "type": {"type": "str", "choices": _PRIVATE_VLAN_TYPE_CHOICES},
                         "associated": {"type": "list", "elements": "int"},
                     },
                 },
@@ -68,15 +82,7 @@ class VlansArgs(object):
         "configuration": {"type": "bool"},
         "running_config": {"type": "str"},
         "state": {
-            "choices": [
-                "merged",
-                "replaced",
-                "overridden",
-                "deleted",
-                "rendered",
-                "parsed",
-                "gathered",
-            ],
+            "choices": _STATE_CHOICES,
             "default": "merged",
             "type": "str",
         },
@@ -52,7 +52,9 @@ class VlansFacts(object):
             cmd = "show running-config | sec ^vlan configuration .+"
         else:
             cmd = "show vlan"
-        check_os_type = connection.get_device_info()
+        check_os_type = getattr(self._module, "_ios_device_info", None)
+        if check_os_type is None:
+            check_os_type = connection.get_device_info()
         if check_os_type.get("network_os_type") == "L3":
             return ""
         return connection.get(cmd)
@@ -236,14 +238,17 @@ class VlansFacts(object):
             o.update(m)
             final_objs.append(o)
 
+        # Index VLANs by id so large outputs are not rescanned per lookup
+        vlans_by_id = {}
+        for every in final_objs:
+            vlans_by_id.setdefault(every.get("vlan_id"), []).append(every)
+
         # Appending Remote Span value to related VLAN
         if remote_objs:
             if remote_objs.get("remote_span"):
                 for each in remote_objs.get("remote_span"):
-                    for every in final_objs:
-                        if each == every.get("vlan_id"):
-                            every.update({"remote_span": True})
-                            break
+                    if each in vlans_by_id:
+                        vlans_by_id[each][0].update({"remote_span": True})
 
         # Appending private vlan information to related VLAN
         if pvlan_objs:
@@ -274,9 +279,8 @@ class VlansFacts(object):
 
                 # Associate with the proper VLAN in final_objs
                 for vlan_id, data in pvlan_final.items():
-                    for every in final_objs:
-                        if vlan_id == every.get("vlan_id"):
-                            every.update(data)
+                    for every in vlans_by_id.get(vlan_id, []):
+                        every.update(data)
 
         if final_objs:
             return objs
@@ -1,4 +1,5 @@
 #!/usr/bin/python
+# -*- coding: utf-8 -*-
 #
 # This file is part of Ansible
 #
@@ -943,21 +944,32 @@ commands:
   sample: ['vlan 20', 'name vlan_20', 'mtu 600', 'remote-span']
 """
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.network import (
+    get_resource_connection,
+)
 
 from ansible_collections.cisco.ios.plugins.module_utils.network.ios.argspec.vlans.vlans import (
     VlansArgs,
 )
-from ansible_collections.cisco.ios.plugins.module_utils.network.ios.config.vlans.vlans import Vlans
-from ansible_collections.cisco.ios.plugins.module_utils.network.ios.ios import get_connection
+
+
+_REQUIRED_IF = (
+    ("state", "merged", ("config",)),
+    ("state", "replaced", ("config",)),
+    ("state", "overridden", ("config",)),
+    ("state", "rendered", ("config",)),
+    ("state", "parsed", ("running_config",)),
+)
+_MUTUALLY_EXCLUSIVE = (("config", "running_config"),)
+_OFFLINE_STATES = frozenset(("rendered", "parsed"))
 
 
 def _is_l2_device(module):
-    """fails module if device is L3."""
-    connection = get_connection(module)
-    check_os_type = connection.get_device_info()
-    if check_os_type.get("network_os_type") == "L3":
-        return False
-    return True
+    """Return True unless the device reports itself as L3."""
+    check_os_type = get_resource_connection(module).get_device_info()
+    # VlansFacts.get_vlans_data reads this instead of asking the device again
+    module._ios_device_info = check_os_type
+    return check_os_type.get("network_os_type") != "L3"
 
 
 def main():
@@ -966,27 +978,28 @@ def main():
 
     :returns: the result form module invocation
     """
-    required_if = [
-        ("state", "merged", ("config",)),
-        ("state", "replaced", ("config",)),
-        ("state", "overridden", ("config",)),
-        ("state", "rendered", ("config",)),
-        ("state", "parsed", ("running_config",)),
-    ]
-    mutually_exclusive = [("config", "running_config")]
-
     module = AnsibleModule(
         argument_spec=VlansArgs.argument_spec,
-        required_if=required_if,
-        mutually_exclusive=mutually_exclusive,
+        required_if=_REQUIRED_IF,
+        mutually_exclusive=_MUTUALLY_EXCLUSIVE,
         supports_check_mode=True,
     )
 
-    if _is_l2_device(module) or module.params.get("state") in ["rendered", "parsed"]:
-        result = Vlans(module).execute_module()
-        module.exit_json(**result)
-    else:
-        module.fail_json("""Resource VLAN is not valid for the target device.""")
+    state = module.params["state"]
+
+    # fail on an L3 device before Vlans gathers facts, so neither
+    # show vlan nor the running-config is read on that path
+    if state not in _OFFLINE_STATES and not _is_l2_device(module):
+        module.fail_json(msg="Resource VLAN is not valid for the target device.")
+
+    # the config engine pulls in every facts module, so only load it
+    # once the arguments are valid and the device is known to be L2
+    from ansible_collections.cisco.ios.plugins.module_utils.network.ios.config.vlans.vlans import (
+        Vlans,
+    )
+
+    result = Vlans(module).execute_module()
+    module.exit_json(**result)
 
 
 if __name__ == "__main__":
@@ -10,8 +10,12 @@ __metaclass__ = type
 
 from textwrap import dedent
 
+from ansible_collections.cisco.ios.plugins.module_utils.network.ios.facts.vlans.vlans import (
+    VlansFacts,
+)
 from ansible_collections.cisco.ios.plugins.modules import ios_vlans
-from ansible_collections.cisco.ios.tests.unit.compat.mock import patch
+from ansible_collections.cisco.ios.tests.unit.compat import unittest
+from ansible_collections.cisco.ios.tests.unit.compat.mock import MagicMock, patch
 from ansible_collections.cisco.ios.tests.unit.modules.utils import set_module_args
 
 from .ios_module import TestIosModule, load_fixture
@@ -410,6 +414,9 @@ class TestIosVlansModule(TestIosModule):
         commands = ["name test_vlan_200", "no shutdown", "remote-span", "state active", "vlan 200"]
         result = self.execute_module(changed=False)
         self.assertEqual(sorted(result["rendered"]), commands)
+        self._l2_device_command.assert_not_called()
+        self.get_resource_connection_config.assert_not_called()
+        self.get_resource_connection_facts.assert_not_called()
 
     def test_vlan_parsed(self):
         set_module_args(
@@ -596,6 +603,9 @@ class TestIosVlansModule(TestIosModule):
         result = self.execute_module(changed=False)
         self.maxDiff = None
         self.assertEqual(result["parsed"], parsed)
+        self._l2_device_command.assert_not_called()
+        self.get_resource_connection_config.assert_not_called()
+        self.get_resource_connection_facts.assert_not_called()
 
     def test_ios_vlans_gathered(self):
         set_module_args(dict(state="gathered"))
@@ -687,6 +697,7 @@ class TestIosVlansModule(TestIosModule):
         self.assertEqual(result["commands"], commands)
 
     def test_ios_vlans_config_merged_idempotent(self):
+        self.mock_execute_show_command_2.stop()
         self.execute_show_command_2 = self.mock_execute_show_command_2.start()
         self.execute_show_command_2.return_value = dedent(
             """\
@@ -722,6 +733,7 @@ class TestIosVlansModule(TestIosModule):
         self.execute_module(changed=False, commands=[], sort=True)
 
     def test_ios_vlans_config_overridden(self):
+        self.mock_execute_show_command_2.stop()
         self.execute_show_command_2 = self.mock_execute_show_command_2.start()
         self.execute_show_command_2.return_value = dedent(
             """\
@@ -779,6 +791,7 @@ class TestIosVlansModule(TestIosModule):
         self.assertEqual(result["commands"], commands)
 
     def test_ios_delete_vlans_config(self):
+        self.mock_execute_show_command_2.stop()
         self.execute_show_command_2 = self.mock_execute_show_command_2.start()
         self.execute_show_command_2.return_value = dedent(
             """\
@@ -879,3 +892,43 @@ class TestIosVlansModule(TestIosModule):
         result = self.execute_module(changed=False)
         self.maxDiff = None
         self.assertEqual(result["parsed"], parsed)
+
+    def test_ios_vlans_l3_device(self):
+        self._l2_device_command.return_value = False
+        set_module_args(dict(config=[dict(vlan_id=200, name="test_vlan_200")], state="merged"))
+        result = self.execute_module(failed=True)
+        self.assertEqual(result["msg"], "Resource VLAN is not valid for the target device.")
+        self.get_resource_connection_config.assert_not_called()
+        self.execute_show_command.assert_not_called()
+
+    def test_ios_vlans_is_l2_device(self):
+        self.mock_l2_device_command.stop()
+        module = MagicMock()
+        with patch(
+            "ansible_collections.cisco.ios.plugins.modules.ios_vlans.get_resource_connection",
+        ) as get_resource_connection:
+            connection = get_resource_connection.return_value
+            connection.get_device_info.return_value = {"network_os_type": "L3"}
+            self.assertFalse(ios_vlans._is_l2_device(module))
+            get_resource_connection.assert_called_once_with(module)
+            connection.get_device_info.return_value = {"network_os_type": "L2"}
+            self.assertTrue(ios_vlans._is_l2_device(module))
+        self.assertEqual(module._ios_device_info, {"network_os_type": "L2"})
+
+
+class TestIosVlansFacts(unittest.TestCase):
+    def test_get_vlans_data_reuses_device_info(self):
+        module = MagicMock(_ios_device_info={"network_os_type": "L2"})
+        connection = MagicMock()
+        connection.get.return_value = "vlan output"
+        data = VlansFacts(module).get_vlans_data(connection, False)
+        self.assertEqual(data, "vlan output")
+        connection.get_device_info.assert_not_called()
+        connection.get.assert_called_once_with("show vlan")
+
+    def test_get_vlans_data_l3_device(self):
+        module = MagicMock(_ios_device_info={"network_os_type": "L3"})
+        connection = MagicMock()
+        self.assertEqual(VlansFacts(module).get_vlans_data(connection, False), "")
+        connection.get_device_info.assert_not_called()
+        connection.get.assert_not_called()